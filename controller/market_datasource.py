@@ -7,6 +7,7 @@ __license__ = 'MIT'
 
 import datetime
 import json
+import sys
 import typing
 
 import dispatch
@@ -181,7 +182,8 @@ class MarketDatasource(dispatch.Dispatcher):
         """
         json_data = json.loads(json_contents)
 
-        stock_symbol = json_data['Meta Data']['2. Symbol']
+        # Interned so that all price dicts key on the same string object
+        stock_symbol = sys.intern(json_data['Meta Data']['2. Symbol'])
         interval = json_data['Meta Data']['4. Interval']
         time_series = json_data['Time Series (' + interval + ')']
 
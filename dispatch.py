@@ -13,6 +13,9 @@ import typing
 class RecursiveDispatchError(Exception):
     """An exception raised when attempting to dispatch an event while it is
     already dispatching.
+
+    Like assertions, this check is skipped when Python runs with optimizations
+    enabled (`python -O`).
     """
 
     event: '_EventListeners'
@@ -36,101 +39,56 @@ Callbacks can return `False` to halt dispatching to further listeners.
 
 
 
-def _remove_if_found(collection, entry):
-    try:
-        collection.remove(entry)
-    except (KeyError, ValueError):
-        pass  # Ignore if not found
-
-
-
-
 class _EventListeners(object):
     """Holds references to event names and subscribed listeners.
 
     This is used internally by :class:`Dispatcher`.
     """
-    __slots__ = ('name', '_callbacks',
-        '_calling',
-        '_pending_additions', '_pending_removals')
+    __slots__ = ('name', '_callbacks', '_calling')
 
     name: str
 
-    _callbacks: typing.List[_Callback]
-    """All registered callbacks, preserving registration order."""
+    _callbacks: typing.Dict[_Callback, None]
+    """All registered callbacks as keys of an insertion-ordered `dict`,
+    preserving registration order while allowing constant-time membership
+    checks.
+    """
 
     _calling: bool
     """`True` while this event dispatches to its listeners."""
 
-    _pending_additions: typing.List[_Callback]
-    """Callbacks to add after `_calling` becomes `False`, preserving
-    registration order.
-    """
-
-    _pending_removals: typing.Set[_Callback]
-    """Callbacks to remove after `_calling` becomes `False`."""
-
 
     def __init__(self,
         name: str
     ) -> None:
         self.name = name
-        self._callbacks = []
-
+        self._callbacks = {}
         self._calling = False
-        self._pending_additions = []
-        self._pending_removals = set()
 
 
     def add(self,
         callback: _Callback
     ) -> None:
-        if not self._calling:
-            if callback not in self._callbacks:
-                self._callbacks.append(callback)
-
-        elif callback not in self._pending_additions:
-            # Add after done calling
-            _remove_if_found(self._pending_removals, callback)
-            if callback not in self._callbacks:
-                self._pending_additions.append(callback)
+        self._callbacks[callback] = None  # Keeps original position
 
 
     def remove(self,
         callback: _Callback
     ) -> None:
-        if not self._calling:
-            _remove_if_found(self._callbacks, callback)
+        self._callbacks.pop(callback, None)
 
-        elif callback not in self._pending_removals:
-            # Remove after done calling
-            _remove_if_found(self._pending_additions, callback)
-            if callback in self._callbacks:
-                self._pending_removals.add(callback)
 
-
-    def remove_all(self,
+    def remove_many(self,
+        callbacks: typing.AbstractSet[_Callback]
     ) -> None:
-        if not self._calling:
-            self._callbacks.clear()
+        """Remove every listener found in `callbacks` at once."""
+        for callback in callbacks:
+            self._callbacks.pop(callback, None)
 
-        else:  # Remove all after done calling
-            self._pending_additions.clear()
-            self._pending_removals.update(self._callbacks)
 
-
-    def _apply_pending(self
+    def remove_all(self,
     ) -> None:
-        """Applies pending callback additions and removals."""
-        assert not self._calling, \
-            'Cannot apply pending callbacks while calling.'
-
-        for callback in self._pending_removals:
-            self._callbacks.remove(callback)
-        self._pending_removals.clear()
-
-        self._callbacks.extend(self._pending_additions)
-        self._pending_additions.clear()
+        self._callbacks.clear()
 
 
     def __call__(self,
@@ -139,23 +97,72 @@ class _EventListeners(object):
     ) -> bool:
         """Dispatch the event to listeners.
 
+        Listeners see a snapshot of the callbacks bound when dispatch began,
+        so callbacks bound or unbound by listeners take effect on the next
+        dispatch.
+        """
+        return self.dispatch(args, kwargs)
+
+
+    def dispatch(self,
+        args: typing.Tuple[typing.Any, ...],
+        kwargs: typing.Dict[str, typing.Any]
+    ) -> bool:
+        """Dispatch the event to listeners with already-packed positional
+        `args` and keyword `kwargs`, sparing callers that received them as
+        `*args` and `**kwargs` from packing them again.
+
         Called by :meth:`~Dispatcher.emit`
         """
+        if not self._callbacks:
+            return True  # Nothing to notify, and so nothing to guard
+
+        if not __debug__:
+            # Skip the recursion guard along with assertions
+            for callback in tuple(self._callbacks):
+                if callback(*args, **kwargs) is False:
+                    return False  # Don't notify any more listeners
+            return True
+
         if self._calling:
             raise RecursiveDispatchError(self)
 
         self._calling = True
         try:
-            cancelled = False
-            for callback in self._callbacks:
+            for callback in tuple(self._callbacks):
                 if callback(*args, **kwargs) is False:
-                    # Don't notify any more listeners
-                    cancelled = True
-                    break
-            return not cancelled
+                    return False  # Don't notify any more listeners
+            return True
+        finally:
+            self._calling = False
+
+
+    def call_many(self,
+        kwargs_iterable: typing.Iterable[typing.Mapping[str, typing.Any]]
+    ) -> None:
+        """Dispatch the event once for each mapping of keyword arguments in
+        `kwargs_iterable`, resolving listeners only once for the whole batch.
+
+        A listener returning `False` only stops that one dispatch. Callbacks
+        bound or unbound by listeners take effect after the batch.
+
+        Called by :meth:`~Dispatcher.emit_many`
+        """
+        callbacks = tuple(self._callbacks)
+        if not callbacks:
+            return  # Nothing to notify
+
+        if __debug__:
+            if self._calling:
+                raise RecursiveDispatchError(self)
+            self._calling = True
+        try:
+            for kwargs in kwargs_iterable:
+                for callback in callbacks:
+                    if callback(**kwargs) is False:
+                        break  # Don't notify any more listeners of this one
         finally:
             self._calling = False
-            self._apply_pending()
 
 
     def __repr__(self
@@ -173,7 +180,8 @@ class _EventListeners(object):
 class Dispatcher(object):
     """Core class used to enable all functionality in the library.
 
-    Interfaces with :class:`_EventListeners` objects upon instance creation.
+    Interfaces with :class:`_EventListeners` objects, which are created for
+    each event the first time it is bound or accessed.
 
     Events can be created by calling :meth:`register_events` or by the subclass
     definition::
@@ -183,45 +191,44 @@ class Dispatcher(object):
 
     Once defined, an event can be dispatched to listeners by calling :meth:`emit`.
     """
-    __initialized_subclasses: typing.ClassVar[typing.Set[typing.Type['Dispatcher']]] = set()
+    __slots__ = ('__event_listeners',)
 
-    __events_combined: typing.ClassVar[typing.Set[str]]
+    __events_combined: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    """All unique event names declared by this class and its bases, combined
+    once by :meth:`__init_subclass__`.
+    """
 
-    __event_listeners: typing.Dict[str, _EventListeners]
+    __event_listeners: typing.Dict[str, typing.Optional[_EventListeners]]
+    """Registered event names mapped to their listeners, or `None` until an
+    event is first bound or accessed.
+    """
 
     EVENTS: typing.ClassVar[typing.FrozenSet[str]]
     """Set of event names broadcast by `Dispatcher` subclasses."""
 
 
+    def __init_subclass__(cls,
+        **kwargs: typing.Any
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+
+        events_combined: typing.Set[str] = set()
+        for base_cls in cls.__mro__:
+            events_combined.update(getattr(base_cls, 'EVENTS', ()))
+        cls.__events_combined = tuple(events_combined)
+
+
     def __new__(cls,
         *args: typing.Any,
         **kwargs: typing.Any
     ) -> 'Dispatcher':
-        def iter_bases(cls_):
-            if cls_ is not object:
-                yield cls_
-                for base in cls_.__bases__:
-                    for base_cls in iter_bases(base):
-                        yield base_cls
-
-        if cls not in Dispatcher.__initialized_subclasses:
-            events_combined: typing.Set[str] = set()
-            for base_cls in iter_bases(cls):
-                try:
-                    events_combined |= base_cls.EVENTS
-                except AttributeError:
-                    pass
-            cls.__events_combined = events_combined
-            Dispatcher.__initialized_subclasses.add(cls)
-
         new = super(Dispatcher, cls).__new__
         if new is object.__new__:
             instance = new(cls)  # No other arguments allowed for object
         else:
             instance = new(cls, *args, **kwargs)  # type: ignore
 
-        instance.__event_listeners = {}
-        instance.register_events(*cls.__events_combined)
+        instance.__event_listeners = dict.fromkeys(cls.__events_combined)
         return instance
 
 
@@ -241,8 +248,20 @@ class Dispatcher(object):
         Args:
             *names (str): Name or names of the events to register
         """
-        self.__event_listeners.update((name, _EventListeners(name))
-            for name in names if name not in self.__event_listeners)
+        for name in names:
+            self.__event_listeners.setdefault(name, None)
+
+
+    def __get_or_create_event_listeners(self,
+        name: str
+    ) -> _EventListeners:
+        """Return the listeners of registered event `name`, creating them on
+        first use. Raises `KeyError` if `name` isn't registered.
+        """
+        listeners = self.__event_listeners[name]
+        if listeners is None:
+            listeners = self.__event_listeners[name] = _EventListeners(name)
+        return listeners
 
 
     def bind(self,
@@ -265,7 +284,7 @@ class Dispatcher(object):
         maintained relative to the order of binding.
         """
         for name, callback in event_callbacks.items():
-            self.__event_listeners[name].add(callback)
+            self.__get_or_create_event_listeners(name).add(callback)
 
 
     def unbind(self,
@@ -275,9 +294,10 @@ class Dispatcher(object):
 
         Multiple bound methods can be removed at once.
         """
+        callbacks_removed = frozenset(callbacks)
         for listeners in self.__event_listeners.values():
-            for callback in callbacks:
-                listeners.remove(callback)
+            if listeners is not None:
+                listeners.remove_many(callbacks_removed)
 
 
     def emit(self,
@@ -296,7 +316,35 @@ class Dispatcher(object):
             *args (Optional): Positional arguments to be sent to listeners
             **kwargs (Optional): Keyword arguments to be sent to listeners
         """
-        return self.__event_listeners[name](*args, **kwargs)
+        listeners = self.__event_listeners[name]
+        if listeners is None or not listeners._callbacks:
+            return True  # Nothing to notify
+        return listeners.dispatch(args, kwargs)
+
+
+    def emit_many(self,
+        name: str,
+        kwargs_iterable: typing.Iterable[typing.Mapping[str, typing.Any]]
+    ) -> None:
+        """Dispatch an event once for each mapping of keyword arguments in
+        `kwargs_iterable`.
+
+        Listeners are looked up once for the whole batch, rather than once per
+        :meth:`emit`. Callbacks bound or unbound during the batch take effect
+        once it finishes.
+
+        Note:
+            If a listener returns :obj:`False`, only that one dispatch stops
+            notifying other listeners; later mappings are still dispatched.
+
+        Args:
+            name (str): The name of the event to dispatch
+            kwargs_iterable: Keyword arguments to send to listeners, one
+                mapping per dispatch
+        """
+        listeners = self.__event_listeners[name]
+        if listeners is not None:
+            listeners.call_many(kwargs_iterable)
 
 
     def get_event_listeners(self,
@@ -312,7 +360,25 @@ class Dispatcher(object):
 
         .. versionadded:: 0.1.0
         """
-        return self.__event_listeners[name]
+        return self.__get_or_create_event_listeners(name)
+
+
+    def get_emitter(self,
+        name: str
+    ) -> typing.Callable[..., bool]:
+        """Retrieve a callable that dispatches an event by name.
+
+        The result resolves `name` once, so callers that emit the same event
+        repeatedly can keep it instead of calling :meth:`emit` each time.
+        Calling it behaves like ``emit(name, *args, **kwargs)``.
+
+        Args:
+            name (str): The name of the event to dispatch
+
+        Returns:
+            The bound :meth:`_EventListeners.__call__` for the event
+        """
+        return self.__get_or_create_event_listeners(name).__call__
 
 
 
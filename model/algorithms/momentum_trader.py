@@ -27,12 +27,18 @@ class MomentumTrader(Trader):
     environment, but it will almost certainly fail under the pressure of
     trading fees.
 
-    To implement the strategy, this bot will sort all symbols into a list
-    based on the most significant price increases. Bigger increases are
-    intended to be at the front of the list.
+    To implement the strategy, this bot compares each tick's prices against
+    the previous tick's in a single pass, picking the symbol with the most
+    significant price increase to buy and collecting the symbols that dropped
+    to sell.
     """
+    __slots__ = ('_prices_last',)
 
 
+    _LOSS_THRESHOLD: typing.ClassVar[float] = -0.1
+    """Owned stocks are sold once their price changes by this much or lower.
+    """
+
     _prices_last: typing.Optional[typing.Dict[str, float]]
     """Previously seen stock prices used to calculate price changes."""
 
@@ -65,24 +71,26 @@ class MomentumTrader(Trader):
         """
         account = self.get_account()
         assert account is not None, 'Missing TraderAccount'
-        price_deltas = self._calculate_price_deltas()
+        prices_current = self.get_stock_market().get_prices()
+        assert prices_current is not None, 'Stock market prices missing'
+        symbol_to_buy, symbols_to_sell = self._choose_trades(prices_current)
 
         # buy as many shares of the highest priority stock as possible
         # given the current balance
-        free_balance = account.get_balance() - self.get_trading_fee()
-        if free_balance > 0:
-            for stock_symbol in self._choose_symbols_to_buy(price_deltas):
-                price = self.get_stock_market().get_stock_symbol_price(stock_symbol)
-                quantity = free_balance / price
+        if symbol_to_buy is not None:
+            free_balance = account.get_balance() - self.get_trading_fee()
+            if free_balance > 0:
+                quantity = free_balance / prices_current[symbol_to_buy]
 
-                account.buy(stock_symbol, quantity)
-                break
+                account.buy(symbol_to_buy, quantity)
 
         # sell everything that is depreciating
-        owned_stocks = account.get_stocks()
-        for stock_symbol in self._choose_symbols_to_sell(price_deltas):
-            if stock_symbol in owned_stocks and owned_stocks[stock_symbol]:
-                account.sell(stock_symbol, owned_stocks[stock_symbol])
+        if symbols_to_sell:
+            owned_stocks = account.get_stocks()
+            for stock_symbol in symbols_to_sell:
+                shares = owned_stocks.get(stock_symbol)
+                if shares:
+                    account.sell(stock_symbol, shares)
 
 
     def set_algorithm_settings(self,
@@ -104,43 +112,29 @@ class MomentumTrader(Trader):
         self._set_algorithm_settings(algorithm_settings)
 
 
-    def _calculate_price_deltas(self
-    ) -> typing.Dict[str, float]:
-        """Calculates the difference between current stock prices and those
-        seen during the last call.
+    def _choose_trades(self,
+        prices_current: typing.Dict[str, float]
+    ) -> typing.Tuple[typing.Optional[str], typing.List[str]]:
+        """Compare `prices_current` against the prices seen during the last
+        call in a single pass. Return the symbol that would be the best buying
+        investment, being the one whose price increased the most, or `None` if
+        no prices rose; Along with a list of stock symbols that should be sold.
         """
-        prices_current = self.get_stock_market().get_prices()
-        assert prices_current is not None, 'Stock market prices missing'
-
-        price_deltas = {}
-        for stock_symbol, price_current in prices_current.items():
-            if self._prices_last is None:  # First data point
-                price_delta = 0.0
-            else:
-                price_delta = price_current - self._prices_last[stock_symbol]
-            price_deltas[stock_symbol] = price_delta
-
+        prices_last = self._prices_last
         self._prices_last = prices_current
-        return price_deltas
+        if prices_last is None:  # First data point
+            return None, []
 
-    def _choose_symbols_to_buy(self,
-        price_deltas: typing.Dict[str, float]
-    ) -> typing.List[str]:
-        """Rank all symbols first to last based on which ones would be the best
-        buying investment, and return a list of symbols for the result.
-        """
-        return [stock_symbol
-            for stock_symbol, price_delta
-                in sorted(price_deltas.items(), reverse=True,
-                    key=lambda symbol_and_delta: symbol_and_delta[1])
-                if price_delta > 0]
-
-    def _choose_symbols_to_sell(self,
-        price_deltas: typing.Dict[str, float]
-    ) -> typing.List[str]:
-        """Return a list of stock symbols that should be sold."""
-        LOSS_THRESHOLD = -0.1  # Sell if delta goes at least this low
-
-        return [stock_symbol
-            for stock_symbol, price_delta in price_deltas.items()
-                if price_delta <= LOSS_THRESHOLD]
+        loss_threshold = self._LOSS_THRESHOLD
+        symbol_to_buy = None
+        price_delta_best = 0.0  # Only buy rising stocks
+        symbols_to_sell = []
+        for stock_symbol, price_current in prices_current.items():
+            price_delta = price_current - prices_last[stock_symbol]
+            if price_delta > price_delta_best:
+                symbol_to_buy = stock_symbol
+                price_delta_best = price_delta
+            if price_delta <= loss_threshold:
+                symbols_to_sell.append(stock_symbol)
+
+        return symbol_to_buy, symbols_to_sell
@@ -16,6 +16,7 @@ from model.stock_market import StockMarket
 class TraderExample(Trader):
     """An example trader to exercise the `SimModel` stock market simulation.
     """
+    __slots__ = ()
 
 
     @classmethod
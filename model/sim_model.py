@@ -56,6 +56,7 @@ class SimModel(dispatch.Dispatcher):
     stock portfolios of participating traders. This high-level MVC model module
     broadcasts state update events to observers.
     """
+    __slots__ = ('_trader_algorithms', '_stock_market', '_traders')
 
 
     _trader_algorithms: typing.Dict[str, typing.Type['Trader']]
@@ -82,9 +83,11 @@ class SimModel(dispatch.Dispatcher):
         self._stock_market = StockMarket()
         self._traders = {}
 
-        # Add all known Trader implementations
+        # Add all known Trader implementations; Nothing can have bound to
+        # this new model's events yet, so skip emitting for each one
         for trader_subclass in Trader.iter_subclasses():
-            self.add_trader_algorithm(trader_subclass)
+            self._trader_algorithms.setdefault(
+                trader_subclass.get_algorithm_name(), trader_subclass)
 
 
     def reset_market_and_trader_accounts(self
@@ -106,14 +109,14 @@ class SimModel(dispatch.Dispatcher):
 
 
     def get_trader_algorithms(self
-    ) -> typing.List[str]:
-        """Return a `list` of registered trader algorithm names usable by
-        participating traders.
+    ) -> typing.Collection[str]:
+        """Return a live view of registered trader algorithm names usable by
+        participating traders. Callers needing a snapshot should copy it.
 
         This result changes following the `SIMMODEL_TRADER_ALGORITHM_ADDED`
         event.
         """
-        return list(self._trader_algorithms.keys())
+        return self._trader_algorithms.keys()
 
     def add_trader_algorithm(self,
         trader_class: typing.Type['Trader']
@@ -142,10 +145,10 @@ class SimModel(dispatch.Dispatcher):
         If no registered `Trader` uses `algorithm_name`, raises
         `UnrecognizedAlgorithmError`.
         """
-        try:
-            return self._trader_algorithms[algorithm_name]
-        except KeyError as e:
-            raise UnrecognizedAlgorithmError(algorithm_name) from e
+        trader_class = self._trader_algorithms.get(algorithm_name)
+        if trader_class is None:  # Registered classes are never None
+            raise UnrecognizedAlgorithmError(algorithm_name)
+        return trader_class
 
     def get_trader_algorithm_settings_defaults(self,
         algorithm: str
@@ -176,14 +179,15 @@ class SimModel(dispatch.Dispatcher):
 
 
     def get_traders(self
-    ) -> typing.List['Trader']:
-        """Return a `list` of the simulation's participating `Trader`s, which
-        each expose their configuration and `TraderAccount` interfaces.
+    ) -> typing.Collection['Trader']:
+        """Return a live view of the simulation's participating `Trader`s,
+        which each expose their configuration and `TraderAccount` interfaces.
+        Callers needing a snapshot should copy it.
 
         This result changes following `SIMMODEL_TRADER_ADDED` and
         `SIMMODEL_TRADER_REMOVED` events.
         """
-        return list(self._traders.values())
+        return self._traders.values()
 
     def get_trader(self,
         name: str
@@ -111,14 +111,17 @@ class StockMarket(dispatch.Dispatcher):
     prices accumulated over simulation runs. To begin a new simulation, the
     stock market can be reset.
     """
+    __slots__ = ('_price_times', '_price_rows')
 
 
     _price_times: typing.List[datetime.datetime]
-    """A `list` of times for the price readings stored in `_symbol_prices`."""
+    """A `list` of times for the price readings stored in `_price_rows`."""
 
-    _symbol_prices: typing.Dict[str, typing.List[float]]
-    """A `dict` of included stock symbols mapped to `list`s of recorded prices
-    corresponding to insertion times within `_price_times`.
+    _price_rows: typing.List[typing.Dict[str, float]]
+    """A `list` of `dict`s, each mapping every included stock symbol to its
+    recorded price at the corresponding insertion time within `_price_times`.
+    These rows are shared with `get_prices` callers, so they are never
+    modified after being added.
     """
 
     EVENTS: typing.ClassVar[typing.FrozenSet[str]] = frozenset([
@@ -131,7 +134,7 @@ class StockMarket(dispatch.Dispatcher):
     ) -> None:
         """Initialize this `StockMarket` with no stock price readings."""
         self._price_times = []
-        self._symbol_prices = {}
+        self._price_rows = []
 
 
     def clear(self
@@ -145,7 +148,7 @@ class StockMarket(dispatch.Dispatcher):
         #   return  # Nothing to clear
 
         self._price_times.clear()
-        self._symbol_prices.clear()
+        self._price_rows.clear()
         self.emit('STOCKMARKET_CLEARED',
             market=self)
 
@@ -175,62 +178,55 @@ class StockMarket(dispatch.Dispatcher):
             if not price > 0:
                 raise InvalidSharePriceError(stock_symbol, price)
 
-        if not self._symbol_prices:  # First datapoint
+        price_times = self._price_times
+        price_rows = self._price_rows
+        if not price_rows:  # First datapoint
             if not stock_symbol_prices:
                 # Need at least one initial stock
                 raise StockSymbolMissingError(set(), set())
 
-            # Initialize storage
-            for stock_symbol in stock_symbol_prices.keys():
-                self._symbol_prices[stock_symbol] = []
-
         else:
             # Must include previously-seen symbols
-            symbols_old = set(self._symbol_prices.keys())
-            symbols_new = set(stock_symbol_prices.keys())
-            if symbols_old != symbols_new:
-                raise StockSymbolMissingError(symbols_old, symbols_new)
+            prices_previous = price_rows[-1]
+            if stock_symbol_prices.keys() != prices_previous.keys():
+                raise StockSymbolMissingError(
+                    set(prices_previous), set(stock_symbol_prices))
 
             # Times must be consecutive
-            time_previous = self._price_times[-1]
+            time_previous = price_times[-1]
             if not time > time_previous:
                 raise NonconsecutiveTimeError(time, time_previous)
 
-        # Save valid datapoint
-        self._price_times.append(time)
-        for stock_symbol, price in stock_symbol_prices.items():
-            self._symbol_prices[stock_symbol].append(price)
+        # Save valid datapoint, copied in case the caller changes theirs
+        price_times.append(time)
+        price_rows.append(dict(stock_symbol_prices))
         self.emit('STOCKMARKET_ADDITION',
             market=self,
             time=time,
             stock_symbol_prices=stock_symbol_prices)
 
 
-    def _get_prices_at_index(self,
-        index: int
-    ) -> typing.Dict[str, float]:
-        """Return a mapping of stock symbols to their prices per share at
-        sample `index`.
-        """
-        
-        return {stock_symbol: prices[index]
-            for stock_symbol, prices in self._symbol_prices.items()}
-
-
     def get_prices(self,
         time: typing.Optional[datetime.datetime] = None
     ) -> typing.Optional[typing.Dict[str, float]]:
         """Return a `dict` mapping stock symbol keys to their price-per-share
         values that follow `time`, or `None` if no data had been added by that
         time. If `time` is `None`, the most recent prices are returned.
+
+        The returned `dict` is this market's own record of those prices, shared
+        between all callers, so it must not be modified.
         """
-        if time is None:  # Get most recent prices
-            index = len(self._price_times)
+        price_times = self._price_times
+        if (time is None  # Get most recent prices
+            or price_times and not time < price_times[-1]
+        ):
+            # Times only ever increase, so nothing newer could follow
+            index = len(price_times)
         else:
-            index = bisect.bisect_right(self._price_times, time)
+            index = bisect.bisect_right(price_times, time)
 
         return (None if index == 0
-            else self._get_prices_at_index(index - 1))
+            else self._price_rows[index - 1])
 
 
     def iter_prices(self
@@ -238,9 +234,10 @@ class StockMarket(dispatch.Dispatcher):
         """Return an iterator that yields times with `dict`s that map stock
         symbols to their prices in reverse chronological order. This iterator
         should be iterated immediately, as market changes will invalidate it.
+        The yielded `dict`s are shared, and must not be modified.
         """
-        for index, time in enumerate(reversed(self._price_times)):
-            yield time, self._get_prices_at_index(index)
+        # Both lists are walked backwards together, yielding the stored rows
+        yield from zip(reversed(self._price_times), reversed(self._price_rows))
 
 
     def get_stock_symbol_price(self,
@@ -254,8 +251,8 @@ class StockMarket(dispatch.Dispatcher):
         This result changes upon `STOCKMARKET_ADDITION` and
         `STOCKMARKET_CLEARED` events.
         """
-        try:
-            return self._symbol_prices[stock_symbol][-1]
-
-        except KeyError as e:
-            raise StockSymbolUnrecognizedError(stock_symbol) from e
+        price_rows = self._price_rows
+        price = price_rows[-1].get(stock_symbol) if price_rows else None
+        if price is None:  # Stored prices are never None
+            raise StockSymbolUnrecognizedError(stock_symbol)
+        return price
@@ -81,10 +81,14 @@ class Trader(dispatch.Dispatcher, metaclass=TraderMeta):
     simulation's `StockMarket`, traders react by buying and selling through
     their associated accounts.
     """
+    __slots__ = ('_stock_market', '_name', '_initial_funds', '_trading_fee',
+        '_algorithm_settings', '_account')
 
 
-    _subclasses: typing.ClassVar[typing.Set[typing.Type['Trader']]] = set()
-    """All registered concrete subclasses of the `Trader` abstract base class.
+    _subclasses: typing.ClassVar[typing.Dict[typing.Type['Trader'], None]] = {}
+    """All registered concrete subclasses of the `Trader` abstract base class,
+    as keys of an insertion-ordered `dict` so that they are always yielded in
+    registration order.
     """
 
     _stock_market: 'StockMarket'
@@ -127,14 +131,14 @@ class Trader(dispatch.Dispatcher, metaclass=TraderMeta):
         if inspect.isabstract(subclass) or subclass in cls._subclasses:
             return False
 
-        cls._subclasses.add(subclass)
+        cls._subclasses[subclass] = None
         return True
 
     @classmethod
     def iter_subclasses(cls
     ) -> typing.Iterator[typing.Type['Trader']]:
         """Return an iterator that yields all concrete `Trader` subclasses that
-        were registered with `register_subclass`.
+        were registered with `register_subclass`, in registration order.
         """
         for subclass in cls._subclasses:
             yield subclass
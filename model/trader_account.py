@@ -5,7 +5,7 @@ __copyright__ = 'Copyright © 2019, Erik Anderson, James Abernathy, and Tyler Ge
 __license__ = 'MIT'
 
 
-import collections
+import types
 import typing
 
 import dispatch
@@ -118,6 +118,9 @@ class TraderAccount(dispatch.Dispatcher):
     effectively excluded from the simulation, and so traders must create new
     accounts if they need to continue participating.
     """
+    __slots__ = ('_stock_market', '_trader', '_balance_initial', '_balance',
+        '_num_purchases', '_num_sales', '_purchases_cost', '_sales_profit',
+        '_stocks', '_frozen')
 
 
     _MAX_ROUNDING_ERROR: typing.ClassVar[float] = 1e-6
@@ -154,9 +157,9 @@ class TraderAccount(dispatch.Dispatcher):
     _sales_profit: float
     """The total profit of all sales made with `sell()`."""
 
-    _stocks: typing.DefaultDict[str, float]
-    """A `collections.defaultdict` of owned stock symbols mapped to
-    non-negative quantities owned, defaulting to `0.0` for new keys.
+    _stocks: typing.Dict[str, float]
+    """A `dict` of owned stock symbols mapped to positive quantities owned.
+    Symbols are removed once all of their shares are sold.
     """
 
     _frozen: bool
@@ -185,7 +188,7 @@ class TraderAccount(dispatch.Dispatcher):
         self._num_purchases = self._num_sales = 0
         self._purchases_cost = self._sales_profit = 0.0
 
-        self._stocks = collections.defaultdict(float)  # Default to 0.0
+        self._stocks = {}
         self._frozen = False
 
 
@@ -212,14 +215,15 @@ class TraderAccount(dispatch.Dispatcher):
         return self._balance
 
     def get_stocks(self
-    ) -> typing.Dict[str, float]:
+    ) -> typing.Mapping[str, float]:
         """Return the quantities of stock shares that this account holds as a
-        `dict` mapping stock symbols to non-negative quantities.
+        read-only live mapping of stock symbols to positive quantities.
+        Callers needing a snapshot should copy it.
 
         This result changes upon `TRADERACCOUNT_BOUGHT` and
         `TRADERACCOUNT_SOLD` events.
         """
-        return self._stocks.copy()
+        return types.MappingProxyType(self._stocks)
 
 
     def is_frozen(self
@@ -245,7 +249,7 @@ class TraderAccount(dispatch.Dispatcher):
 
         Triggers `TRADERACCOUNT_FROZEN` if successful.
         """
-        if self.is_frozen():
+        if self._frozen:
             return
 
         self._frozen = True
@@ -276,27 +280,27 @@ class TraderAccount(dispatch.Dispatcher):
 
         Triggers `TRADERACCOUNT_BOUGHT` if successful.
         """
-        if self.is_frozen():
+        if self._frozen:
             raise FrozenError()
 
+        balance = self._balance
         fee = self._trader.get_trading_fee()
         price_per_share = self._stock_market.get_stock_symbol_price(stock_symbol)
         cost = shares * price_per_share + fee
-        if cost > self.get_balance():
-            if self.get_balance() - cost < -self._MAX_ROUNDING_ERROR:
-                raise InsufficientBalanceError(
-                    stock_symbol, cost, self.get_balance())
+        if cost > balance:
+            if balance - cost < -self._MAX_ROUNDING_ERROR:
+                raise InsufficientBalanceError(stock_symbol, cost, balance)
 
             # Ignore rounding error and spend all funds
-            cost = self.get_balance()
+            cost = balance
             shares = (cost - fee) / price_per_share
 
         if shares <= 0:
             raise StockShareQuantityError(stock_symbol, shares)
 
         # Make transaction
-        self._balance -= cost
-        self._stocks[stock_symbol] += shares
+        self._balance = balance - cost
+        self._stocks[stock_symbol] = self._stocks.get(stock_symbol, 0.0) + shares
 
         self._num_purchases += 1
         self._purchases_cost += cost
@@ -329,30 +333,35 @@ class TraderAccount(dispatch.Dispatcher):
 
         Triggers `TRADERACCOUNT_SOLD` if successful.
         """
-        if self.is_frozen():
+        if self._frozen:
             raise FrozenError()
 
-        if shares > self._stocks[stock_symbol]:
-            if self._stocks[stock_symbol] - shares < -self._MAX_ROUNDING_ERROR:
+        shares_owned = self._stocks.get(stock_symbol, 0.0)
+        if shares > shares_owned:
+            if shares_owned - shares < -self._MAX_ROUNDING_ERROR:
                 raise InsufficientStockSharesError(
-                    stock_symbol, shares, self._stocks[stock_symbol])
+                    stock_symbol, shares, shares_owned)
 
             # Ignore rounding error and sell all shares
-            shares = self._stocks[stock_symbol]
+            shares = shares_owned
 
         if shares <= 0:
             raise StockShareQuantityError(stock_symbol, shares)
 
+        balance = self._balance
         price_per_share = self._stock_market.get_stock_symbol_price(stock_symbol)
         profit = shares * price_per_share - self._trader.get_trading_fee()
-        if self.get_balance() + profit < 0:
+        if balance + profit < 0:
             # Trading fee made profit negative
-            raise InsufficientBalanceError(
-                stock_symbol, -profit, self.get_balance())
+            raise InsufficientBalanceError(stock_symbol, -profit, balance)
 
         # Make transaction
-        self._balance += profit
-        self._stocks[stock_symbol] -= shares
+        self._balance = balance + profit
+        shares_remaining = shares_owned - shares
+        if shares_remaining > 0:
+            self._stocks[stock_symbol] = shares_remaining
+        else:  # Sold out
+            del self._stocks[stock_symbol]
 
         self._num_sales += 1
         self._sales_profit += profit
@@ -382,14 +391,18 @@ class TraderAccount(dispatch.Dispatcher):
         display-language-independent English identifiers, like `'PROFIT_NET'`,
         and the associated values can be converted to `str`.
         """
-        fee = self._trader.get_trading_fee()
-        stocks_value = sum(
-            quantity * self._stock_market.get_stock_symbol_price(symbol) - fee
-                for symbol, quantity in self._stocks.items() if quantity > 0)
+        stocks_value = 0.0
+        if self._stocks:
+            # Value holdings from one lookup of the latest prices
+            prices = self._stock_market.get_prices()
+            assert prices is not None, 'Stock market prices missing'
+            fee = self._trader.get_trading_fee()
+            stocks_value = sum(quantity * prices[symbol] - fee
+                for symbol, quantity in self._stocks.items())
 
         return {
             'PROFIT_NET': self._balance + stocks_value - self._balance_initial,
-            'FROZEN': self.is_frozen(),
+            'FROZEN': self._frozen,
 
             'PURCHASE_COUNT': self._num_purchases,
             'PURCHASE_AVERAGE': (self._purchases_cost / self._num_purchases